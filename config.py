@@ -1,56 +1,105 @@
-LLM_CONFIG = {
-    "model": "llama3.1:8b",
-    "temperature": 0.7,
-    "base_url": "http://localhost:11434",
-    "timeout": 120,
-    "max_retries": 3
-}
+import bisect
+import math
+import os
+import string
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 
-NEGOTIATION_CONFIG = {
-    "risk_threshold": 0.7,
-    "max_negotiation_rounds": 3,
-    "agents_per_negotiation": 3,
-    "default_adjustment_minutes": 2,
-    "max_adjustment_minutes": 8,
-    "negotiation_timeout": 300
-}
 
-RISK_THRESHOLDS = {
-    "normal": 0.7,
-    "moderate": 1.0,
-    "high": 1.5,
-    "critical": 1.5
-}
+@dataclass(slots=True)
+class LLMConfig:
+    """Connection and sampling settings for the Ollama chat model"""
+    model: str = "llama3.1:8b"
+    temperature: float = 0.7
+    base_url: str = "http://localhost:11434"
+    timeout: int = 120
+    max_retries: int = 3
+    keep_alive: int = -1  # seconds Ollama keeps the model loaded; -1 = never unload
+    num_predict: int = 256  # output token cap; replies are one small JSON object
+    response_format: str = "json"  # Ollama constrained decoding; "" for free text
+    max_connections: int = 32  # pooled keep-alive HTTP connections to Ollama
 
-FEASIBILITY_CONFIG = {
-    "high_flexibility_threshold": 0.3,
-    "low_flexibility_threshold": -0.3,
-    "base_feasibility_score": 0.6,
-    "flexibility_bonus": 0.2,
-    "flexibility_penalty": 0.3,
-    "adjustment_penalty_per_minute": 0.05,
-    "constraint_violation_penalty": 0.7
-}
+@dataclass(slots=True)
+class NegotiationConfig:
+    """Limits applied to each negotiation round"""
+    risk_threshold: float = 0.7
+    max_negotiation_rounds: int = 3
+    agents_per_negotiation: int = 3
+    default_adjustment_minutes: int = 2
+    max_adjustment_minutes: int = 8
+    negotiation_timeout: int = 300
 
-REPUTATION_CONFIG = {
-    "initial_reputation": 1.0,
-    "fulfillment_bonus": 0.1,
-    "violation_penalty": 0.2,
-    "violation_threshold": 3,
-    "min_reputation": 0.0,
-    "max_reputation": 1.0
-}
+@dataclass(slots=True)
+class RiskThresholds:
+    """Congestion ratio boundaries between status levels"""
+    normal: float = 0.7
+    moderate: float = 1.0
+    high: float = 1.5
+    critical: float = 1.5
+
+@dataclass(slots=True)
+class FeasibilityConfig:
+    """Weights used when scoring a timing adjustment"""
+    high_flexibility_threshold: float = 0.3
+    low_flexibility_threshold: float = -0.3
+    base_feasibility_score: float = 0.6
+    flexibility_bonus: float = 0.2
+    flexibility_penalty: float = 0.3
+    adjustment_penalty_per_minute: float = 0.05
+    constraint_violation_penalty: float = 0.7
+
+@dataclass(slots=True)
+class ReputationConfig:
+    """Reputation bookkeeping for commitment fulfillment"""
+    initial_reputation: float = 1.0
+    fulfillment_bonus: float = 0.1
+    violation_penalty: float = 0.2
+    violation_threshold: int = 3
+    min_reputation: float = 0.0
+    max_reputation: float = 1.0
+
+@dataclass(slots=True)
+class PerformanceMetrics:
+    """Thresholds used to grade coordination results"""
+    excellent_risk_reduction: float = 0.5
+    good_risk_reduction: float = 0.3
+    acceptable_risk_reduction: float = 0.1
+    max_acceptable_final_risk: float = 1.0
+    min_agent_participation: float = 0.5
+    max_negotiation_time: int = 300
+
+# Settings are slotted instances rather than dicts so hot-path reads are
+# attribute loads; they stay mutable so test configs can override fields.
+LLM_CONFIG = LLMConfig()
+NEGOTIATION_CONFIG = NegotiationConfig()
+RISK_THRESHOLDS = RiskThresholds()
+FEASIBILITY_CONFIG = FeasibilityConfig()
+REPUTATION_CONFIG = ReputationConfig()
+
+# The NegotiationConfig fields an episode actually reads, and so the only ones
+# run_coordination_episode accepts as per-episode overrides.
+EPISODE_OVERRIDE_FIELDS = frozenset({"risk_threshold", "default_adjustment_minutes"})
+
+# Static tables below are frozen into MappingProxyType views (lists become
+# tuples) so they can be shared without defensive copies.
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 SCENARIOS = {
     "demo": {
         "name": "Demo Scenario",
         "description": "Basic demonstration with 3 classrooms",
+        "default_end_time": "12:30",
         "classrooms": [
             {
                 "id": "C101",
                 "students": 80,
                 "professor_flexibility": 0.3,
-                "base_end_time": "12:30",
                 "subject": "Mathematics",
                 "professor_name": "Dr. Smith"
             },
@@ -58,7 +107,6 @@ SCENARIOS = {
                 "id": "C102", 
                 "students": 95,
                 "professor_flexibility": -0.2,
-                "base_end_time": "12:30",
                 "subject": "Chemistry",
                 "professor_name": "Prof. Johnson"
             },
@@ -66,7 +114,6 @@ SCENARIOS = {
                 "id": "C103",
                 "students": 60,
                 "professor_flexibility": 0.5,
-                "base_end_time": "12:30",
                 "subject": "Literature",
                 "professor_name": "Dr. Davis"
             }
@@ -77,12 +124,12 @@ SCENARIOS = {
     "stress": {
         "name": "Stress Test Scenario",
         "description": "High congestion scenario with 4 large classrooms",
+        "default_end_time": "12:30",
         "classrooms": [
             {
                 "id": "C201",
                 "students": 120,
                 "professor_flexibility": -0.7,
-                "base_end_time": "12:30",
                 "subject": "Engineering",
                 "professor_name": "Dr. Wilson"
             },
@@ -90,7 +137,6 @@ SCENARIOS = {
                 "id": "C202",
                 "students": 110,
                 "professor_flexibility": 0.8,
-                "base_end_time": "12:30",
                 "subject": "Philosophy",
                 "professor_name": "Prof. Martinez"
             },
@@ -98,7 +144,6 @@ SCENARIOS = {
                 "id": "C203",
                 "students": 95,
                 "professor_flexibility": 0.2,
-                "base_end_time": "12:30",
                 "subject": "Biology",
                 "professor_name": "Dr. Chen"
             },
@@ -106,7 +151,6 @@ SCENARIOS = {
                 "id": "C204",
                 "students": 85,
                 "professor_flexibility": -0.5,
-                "base_end_time": "12:30",
                 "subject": "History",
                 "professor_name": "Prof. Thompson"
             }
@@ -117,12 +161,12 @@ SCENARIOS = {
     "balanced": {
         "name": "Balanced Load Scenario",
         "description": "Well-distributed load with mixed flexibility",
+        "default_end_time": "12:30",
         "classrooms": [
             {
                 "id": "C301",
                 "students": 70,
                 "professor_flexibility": 0.4,
-                "base_end_time": "12:30",
                 "subject": "Computer Science",
                 "professor_name": "Dr. Lee"
             },
@@ -130,7 +174,6 @@ SCENARIOS = {
                 "id": "C302",
                 "students": 75,
                 "professor_flexibility": -0.1,
-                "base_end_time": "12:30",
                 "subject": "Psychology",
                 "professor_name": "Prof. Garcia"
             },
@@ -138,7 +181,6 @@ SCENARIOS = {
                 "id": "C303",
                 "students": 65,
                 "professor_flexibility": 0.6,
-                "base_end_time": "12:30",
                 "subject": "Art History",
                 "professor_name": "Dr. Brown"
             },
@@ -146,7 +188,6 @@ SCENARIOS = {
                 "id": "C304",
                 "students": 80,
                 "professor_flexibility": -0.3,
-                "base_end_time": "12:30",
                 "subject": "Economics",
                 "professor_name": "Prof. Taylor"
             }
@@ -157,12 +198,12 @@ SCENARIOS = {
     "extreme": {
         "name": "Extreme Congestion Scenario",
         "description": "Maximum stress test with very high congestion",
+        "default_end_time": "12:30",
         "classrooms": [
             {
                 "id": "C401",
                 "students": 150,
                 "professor_flexibility": -0.9,
-                "base_end_time": "12:30",
                 "subject": "Lecture Hall A",
                 "professor_name": "Dr. Anderson"
             },
@@ -170,7 +211,6 @@ SCENARIOS = {
                 "id": "C402",
                 "students": 140,
                 "professor_flexibility": 0.9,
-                "base_end_time": "12:30",
                 "subject": "Lecture Hall B", 
                 "professor_name": "Prof. White"
             },
@@ -178,7 +218,6 @@ SCENARIOS = {
                 "id": "C403",
                 "students": 130,
                 "professor_flexibility": 0.1,
-                "base_end_time": "12:30",
                 "subject": "Lecture Hall C",
                 "professor_name": "Dr. Miller"
             }
@@ -189,12 +228,12 @@ SCENARIOS = {
     "assignment_demo": {
         "name": "Assignment Demo Scenario",
         "description": "Monday 11:00 slot with 5 classrooms; designed to test staggered exits at a road bottleneck",
+        "default_end_time": "11:00",
         "classrooms": [
             {
                 "id": "C501",
                 "students": 120,
                 "professor_flexibility": -0.6,
-                "base_end_time": "11:00",
                 "subject": "Algorithms",
                 "professor_name": "Dr. Rao"
             },
@@ -202,7 +241,6 @@ SCENARIOS = {
                 "id": "C502",
                 "students": 100,
                 "professor_flexibility": 0.2,
-                "base_end_time": "11:00",
                 "subject": "Physics",
                 "professor_name": "Prof. Mehta"
             },
@@ -210,7 +248,6 @@ SCENARIOS = {
                 "id": "C503",
                 "students": 90,
                 "professor_flexibility": 0.5,
-                "base_end_time": "11:00",
                 "subject": "Econometrics",
                 "professor_name": "Dr. Kapoor"
             },
@@ -218,7 +255,6 @@ SCENARIOS = {
                 "id": "C504",
                 "students": 85,
                 "professor_flexibility": -0.2,
-                "base_end_time": "11:00",
                 "subject": "Data Structures",
                 "professor_name": "Prof. Nair"
             },
@@ -226,7 +262,6 @@ SCENARIOS = {
                 "id": "C505",
                 "students": 80,
                 "professor_flexibility": 0.0,
-                "base_end_time": "11:00",
                 "subject": "Sociology",
                 "professor_name": "Dr. Kaur"
             }
@@ -235,6 +270,8 @@ SCENARIOS = {
     }
 }
 
+SCENARIOS = _freeze(SCENARIOS)
+
 LOGGING_CONFIG = {
     "level": "INFO",
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -262,7 +299,7 @@ Focus on practical solutions that balance efficiency with fairness.""",
 - Critical time slots: {critical_times}
 
 Based on this analysis, provide 2-3 specific recommendations for classroom timing adjustments.
-Format your response as a JSON object with recommendations.""",
+Respond with exactly one JSON object with recommendations and nothing else.""",
 
     "classroom_system": """You are Classroom Agent {classroom_id}, representing a classroom in a traffic coordination system.
 
@@ -296,9 +333,40 @@ Based on your classroom's constraints and the traffic situation, decide:
 2. What adjustment amount makes sense?
 3. What are your autonomous reasoning steps?
 
-Provide your response as JSON with: decision, proposed_adjustment, reasoning"""
+Respond with exactly one JSON object and nothing else, with keys: decision, proposed_adjustment, reasoning"""
+}
+
+AGENT_PROMPTS = _freeze(AGENT_PROMPTS)
+
+_PROMPT_FORMATTER = string.Formatter()
+
+# Each prompt is split into (literal, field, format_spec, conversion) segments
+# once at import so rendering skips re-parsing the template on every call.
+_COMPILED_PROMPTS = {
+    name: tuple(_PROMPT_FORMATTER.parse(template))
+    for name, template in AGENT_PROMPTS.items()
 }
 
+_PROMPT_FIELDS = {
+    name: frozenset(field for _, field, _, _ in segments if field is not None)
+    for name, segments in _COMPILED_PROMPTS.items()
+}
+
+def render_prompt(prompt_name: str, **values: Any) -> str:
+    parts = []
+    for literal, field, format_spec, conversion in _COMPILED_PROMPTS[prompt_name]:
+        parts.append(literal)
+        if field is not None:
+            try:
+                value = values[field]
+            except KeyError:
+                missing = sorted(_PROMPT_FIELDS[prompt_name] - values.keys())
+                raise KeyError(f"Prompt {prompt_name!r} is missing values for: {', '.join(missing)}") from None
+            if conversion:
+                value = _PROMPT_FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+    return "".join(parts)
+
 EXPERIMENTAL_CONFIG = {
     "enable_commitment_tracking": True,
     "enable_reputation_system": True,
@@ -307,7 +375,9 @@ EXPERIMENTAL_CONFIG = {
     "simulation_speed": "normal",
     "random_seed": 42,
     "max_episodes": 10,
-    "episode_interval_days": 7
+    "episode_interval_days": 7,
+    "max_concurrent_episodes": 4,
+    "episode_timeout_seconds": 600
 }
 
 TEST_CONFIGS = {
@@ -351,60 +421,172 @@ TEST_CONFIGS = {
     }
 }
 
-PERFORMANCE_METRICS = {
-    "excellent_risk_reduction": 0.5,
-    "good_risk_reduction": 0.3,
-    "acceptable_risk_reduction": 0.1,
-    "max_acceptable_final_risk": 1.0,
-    "min_agent_participation": 0.5,
-    "max_negotiation_time": 300
+TEST_CONFIGS = _freeze(TEST_CONFIGS)
+
+PERFORMANCE_METRICS = PerformanceMetrics()
+
+@dataclass(slots=True)
+class Classroom:
+    """Static description of one classroom in a scenario"""
+    id: str
+    students: int
+    professor_flexibility: float
+    base_end_time: str
+    subject: str
+    professor_name: str
+
+@dataclass(slots=True)
+class Scenario:
+    """Typed scenario record with slotted classroom entries"""
+    name: str
+    description: str
+    default_end_time: str
+    classrooms: Tuple[Classroom, ...]
+    bottleneck_capacity: int
+
+def get_end_time(scenario: Mapping[str, Any], classroom: Mapping[str, Any]) -> str:
+    return classroom.get("base_end_time", scenario["default_end_time"])
+
+def parse_clock_minutes(clock_time: str) -> int:
+    hours, minutes = clock_time.split(":")
+    return int(hours) * 60 + int(minutes)
+
+def format_clock_minutes(minute_of_day: int) -> str:
+    # Matches datetime arithmetic: offsets past midnight wrap around the day.
+    return f"{(minute_of_day // 60) % 24:02d}:{minute_of_day % 60:02d}"
+
+@dataclass(frozen=True, slots=True)
+class ScenarioColumns:
+    """Column-wise (struct-of-arrays) view of a scenario's classrooms"""
+    ids: Tuple[str, ...]
+    students: Tuple[int, ...]
+    professor_flexibility: Tuple[float, ...]
+    base_end_times: Tuple[str, ...]
+    base_end_minutes: Tuple[int, ...]  # base_end_times as minutes past midnight
+    bottleneck_capacity: int
+
+def _build_columns(scenario: Mapping[str, Any]) -> ScenarioColumns:
+    classrooms = scenario["classrooms"]
+    end_times = tuple(get_end_time(scenario, c) for c in classrooms)
+    return ScenarioColumns(
+        ids=tuple(c["id"] for c in classrooms),
+        students=tuple(c["students"] for c in classrooms),
+        professor_flexibility=tuple(c["professor_flexibility"] for c in classrooms),
+        base_end_times=end_times,
+        base_end_minutes=tuple(parse_clock_minutes(end_time) for end_time in end_times),
+        bottleneck_capacity=scenario["bottleneck_capacity"]
+    )
+
+_SCENARIO_COLUMNS = {name: _build_columns(scenario) for name, scenario in SCENARIOS.items()}
+
+SCENARIOS_TYPED = {
+    name: Scenario(**{
+        **scenario,
+        "classrooms": tuple(
+            Classroom(**{**c, "base_end_time": get_end_time(scenario, c)})
+            for c in scenario["classrooms"]
+        )
+    })
+    for name, scenario in SCENARIOS.items()
+}
+
+# Classroom ids are globally unique (checked by validate_config), so one flat
+# index resolves any id without scanning every scenario.
+CLASSROOM_INDEX: Dict[str, Tuple[str, Mapping[str, Any]]] = {
+    classroom["id"]: (name, classroom)
+    for name, scenario in SCENARIOS.items()
+    for classroom in scenario["classrooms"]
 }
 
-def get_scenario_config(scenario_name: str) -> dict:
-    return SCENARIOS.get(scenario_name, SCENARIOS["demo"])
+# Fallbacks bound once so unknown names cost a single .get per call.
+_DEFAULT_SCENARIO_VIEW = SCENARIOS["demo"]
+_DEFAULT_SCENARIO = SCENARIOS_TYPED["demo"]
+_DEFAULT_SCENARIO_COLUMNS = _SCENARIO_COLUMNS["demo"]
+_DEFAULT_TEST_CONFIG_VIEW = TEST_CONFIGS["quick_test"]
+
+def get_scenario_config(scenario_name: str) -> Mapping[str, Any]:
+    return SCENARIOS.get(scenario_name, _DEFAULT_SCENARIO_VIEW)
+
+def get_scenario(scenario_name: str) -> Scenario:
+    return SCENARIOS_TYPED.get(scenario_name, _DEFAULT_SCENARIO)
 
-def get_test_config(test_name: str) -> dict:
-    return TEST_CONFIGS.get(test_name, TEST_CONFIGS["quick_test"])
+def get_scenario_columns(scenario_name: str) -> ScenarioColumns:
+    return _SCENARIO_COLUMNS.get(scenario_name, _DEFAULT_SCENARIO_COLUMNS)
+
+def get_classroom(classroom_id: str) -> Optional[Tuple[str, Mapping[str, Any]]]:
+    return CLASSROOM_INDEX.get(classroom_id)
+
+def get_test_config(test_name: str) -> Mapping[str, Any]:
+    return TEST_CONFIGS.get(test_name, _DEFAULT_TEST_CONFIG_VIEW)
+
+# The shorter-lecture buckets include their upper bound (<= -0.5, <= -0.2),
+# so those bounds are nudged up one ulp to keep bisect_right exact.
+_FLEX_BOUNDS = (math.nextafter(-0.5, math.inf), math.nextafter(-0.2, math.inf), 0.2, 0.5)
+_FLEX_DESCRIPTIONS = (
+    "strongly prefers shorter lectures",
+    "prefers shorter lectures",
+    "flexible with lecture timing",
+    "prefers longer lectures",
+    "strongly prefers longer lectures"
+)
 
 def get_flexibility_description(flexibility: float) -> str:
-    if flexibility <= -0.5:
-        return "strongly prefers shorter lectures"
-    elif flexibility <= -0.2:
-        return "prefers shorter lectures"
-    elif flexibility >= 0.5:
-        return "strongly prefers longer lectures"
-    elif flexibility >= 0.2:
-        return "prefers longer lectures"
-    else:
-        return "flexible with lecture timing"
+    return _FLEX_DESCRIPTIONS[bisect.bisect_right(_FLEX_BOUNDS, flexibility)]
 
-def calculate_suggested_adjustment(professor_flexibility: float) -> int:
-    if professor_flexibility < -FEASIBILITY_CONFIG["low_flexibility_threshold"]:
-        return -NEGOTIATION_CONFIG["default_adjustment_minutes"]
-    elif professor_flexibility > FEASIBILITY_CONFIG["high_flexibility_threshold"]:
-        return NEGOTIATION_CONFIG["default_adjustment_minutes"]
-    else:
-        return NEGOTIATION_CONFIG["default_adjustment_minutes"] if professor_flexibility >= 0 else -NEGOTIATION_CONFIG["default_adjustment_minutes"]
+_RISK_LABELS = ("normal", "moderate", "high", "critical")
+# Built once at import; nothing changes RISK_THRESHOLDS at runtime.
+_RISK_BOUNDS = (RISK_THRESHOLDS.normal, RISK_THRESHOLDS.moderate, RISK_THRESHOLDS.high)
 
-def validate_config():
-    errors = []
-    
-    if not (0 <= RISK_THRESHOLDS["normal"] <= RISK_THRESHOLDS["moderate"] <= RISK_THRESHOLDS["high"]):
-        errors.append("Risk thresholds must be in ascending order")
+def classify_risk(congestion_ratio: float) -> str:
+    # bisect_left keeps the boundaries exclusive: a ratio equal to a
+    # threshold stays in the lower bucket.
+    return _RISK_LABELS[bisect.bisect_left(_RISK_BOUNDS, congestion_ratio)]
+
+def calculate_suggested_adjustment(professor_flexibility: float,
+                                   negotiation: Optional[NegotiationConfig] = None) -> int:
+    # The suggestion follows the sign of the flexibility: extend for
+    # flexibility >= 0, shorten below. The old ladder compared against the
+    # negated low threshold (< 0.3), so [0, 0.3) used to get -default.
+    negotiation = negotiation or NEGOTIATION_CONFIG
+    return int(math.copysign(negotiation.default_adjustment_minutes, professor_flexibility or 1.0))
+
+def _iter_config_errors() -> Iterator[str]:
+    if not (0 <= RISK_THRESHOLDS.normal <= RISK_THRESHOLDS.moderate <= RISK_THRESHOLDS.high):
+        yield "Risk thresholds must be in ascending order"
     
-    if FEASIBILITY_CONFIG["low_flexibility_threshold"] >= FEASIBILITY_CONFIG["high_flexibility_threshold"]:
-        errors.append("Low flexibility threshold must be less than high flexibility threshold")
+    if FEASIBILITY_CONFIG.low_flexibility_threshold >= FEASIBILITY_CONFIG.high_flexibility_threshold:
+        yield "Low flexibility threshold must be less than high flexibility threshold"
     
-    if REPUTATION_CONFIG["min_reputation"] >= REPUTATION_CONFIG["max_reputation"]:
-        errors.append("Min reputation must be less than max reputation")
+    if REPUTATION_CONFIG.min_reputation >= REPUTATION_CONFIG.max_reputation:
+        yield "Min reputation must be less than max reputation"
     
+    id_owners = {}
     for scenario_name, scenario in SCENARIOS.items():
         if scenario["bottleneck_capacity"] <= 0:
-            errors.append(f"Scenario {scenario_name}: bottleneck capacity must be positive")
+            yield f"Scenario {scenario_name}: bottleneck capacity must be positive"
         
         for classroom in scenario["classrooms"]:
             if not (-1.0 <= classroom["professor_flexibility"] <= 1.0):
-                errors.append(f"Scenario {scenario_name}, {classroom['id']}: flexibility must be between -1.0 and 1.0")
+                yield f"Scenario {scenario_name}, {classroom['id']}: flexibility must be between -1.0 and 1.0"
+            if classroom["id"] in id_owners:
+                yield f"Scenario {scenario_name}, {classroom['id']}: classroom id is already used in scenario {id_owners[classroom['id']]}"
+            else:
+                id_owners[classroom["id"]] = scenario_name
+    
+    # Only these keys are routed by test_runner's ablation loop; anything else
+    # (a typo, or a setting it doesn't forward) would run the baseline silently.
+    variation_keys = {"name", "llm_temperature", "enable_llm_reasoning"} | EPISODE_OVERRIDE_FIELDS
+    for variation in TEST_CONFIGS["ablation_study"]["test_variations"]:
+        for key in variation.keys() - variation_keys:
+            yield f"Ablation variation {variation.get('name')}: unknown setting '{key}'"
+
+def validate_config(fail_fast: bool = False):
+    errors = _iter_config_errors()
+    if fail_fast:
+        first_error = next(errors, None)
+        errors = [first_error] if first_error is not None else []
+    else:
+        errors = list(errors)
     
     if errors:
         raise ValueError("Configuration validation failed:\n" + "\n".join(errors))
@@ -414,5 +596,5 @@ def validate_config():
 if __name__ == "__main__":
     validate_config()
     print("Configuration validation passed!")
-else:
+elif os.environ.get("CONFIG_VALIDATE", "1") != "0":
     validate_config()
\ No newline at end of file
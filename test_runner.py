@@ -1,15 +1,73 @@
 import asyncio
+import io
 import sys
 import time
-from simple_langgraph_coordination import SimpleTrafficCoordinationSystem
+from contextvars import ContextVar
+from typing import Optional
 import config
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+
+_SUCCESS_ICONS = ("❌", "✅")  # indexed by the coordination_success bool
+_captured_output: ContextVar[Optional[io.StringIO]] = ContextVar("captured_output", default=None)
+
+def _new_system(*args, **kwargs):
+    # Imported on first use so printing usage doesn't load the LangChain stack.
+    from simple_langgraph_coordination import SimpleTrafficCoordinationSystem
+    return SimpleTrafficCoordinationSystem(*args, **kwargs)
+
+async def _time_bounded(coro):
+    # An episode that overruns the timeout yields None instead of stalling
+    # the rest of the run.
+    try:
+        return await asyncio.wait_for(coro, config.EXPERIMENTAL_CONFIG.get("episode_timeout_seconds"))
+    except asyncio.TimeoutError:
+        return None
+
+async def _gather_bounded(coros):
+    # Episodes are independent LLM round-trips, so they can overlap; the
+    # semaphore keeps the number in flight against one Ollama server bounded.
+    semaphore = asyncio.Semaphore(config.EXPERIMENTAL_CONFIG.get("max_concurrent_episodes", 4))
+    
+    async def run(coro):
+        async with semaphore:
+            return await _time_bounded(coro)
+    
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+class _TaskLocalStdout:
+    """stdout proxy that sends each task's writes to its capture buffer, if any"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        return (_captured_output.get() or self.stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+async def _captured(coro) -> str:
+    # gather runs each coroutine in its own task with a copied context, so the
+    # buffer set here is seen only by this test's prints.
+    buffer = io.StringIO()
+    _captured_output.set(buffer)
+    await coro
+    return buffer.getvalue()
+
+async def _timed_episode(scenario_name: str):
+    system = _new_system()
+    start_time = time.perf_counter()
+    results = await system.run_coordination_episode(scenario_name)
+    return results, time.perf_counter() - start_time
 
 async def run_quick_test():
     print("🚀 Running Quick Test Configuration")
-    system = SimpleTrafficCoordinationSystem("quick_test")
+    system = _new_system("quick_test")
     
-    results = await system.run_coordination_episode("demo")
+    results = await _time_bounded(system.run_coordination_episode("demo"))
+    if results is None:
+        print("⏱️  Quick Test timed out")
+        return None
     metrics = results['coordination_metrics']
     
     print(f"✅ Quick Test Complete:")
@@ -19,56 +77,54 @@ async def run_quick_test():
 
 async def run_stress_test():
     print("🔥 Running Stress Test Configuration")
-    system = SimpleTrafficCoordinationSystem("stress_test")
+    scenarios = ["stress", "extreme"]
+    systems = [_new_system("stress_test") for _ in scenarios]
+    episodes = await _gather_bounded(
+        system.run_coordination_episode(scenario) for system, scenario in zip(systems, scenarios)
+    )
     
-    for scenario in ["stress", "extreme"]:
+    for scenario, results in zip(scenarios, episodes):
         print(f"\n--- {scenario.upper()} Scenario ---")
-        results = await system.run_coordination_episode(scenario)
+        if results is None:
+            print("⏱️  Timed out")
+            continue
         metrics = results['coordination_metrics']
         
         print(f"Risk: {metrics['initial_risk']:.2f} -> {metrics['final_risk']:.2f}")
         print(f"Reduction: {metrics['risk_reduction']:.2f}")
-        print(f"Success: {'✅' if metrics['coordination_success'] else '❌'}")
+        print(f"Success: {_SUCCESS_ICONS[metrics['coordination_success']]}")
 
 async def run_ablation_study():
     print("🔬 Running Ablation Study")
     
     base_scenario = "balanced"
     test_variations = config.TEST_CONFIGS["ablation_study"]["test_variations"]
-    results_comparison = []
     
+    # Settings travel with each episode instead of being patched into config,
+    # so the variations can run side by side.
+    episodes = []
     for variation in test_variations:
         print(f"\n--- Testing: {variation['name']} ---")
-        
-        original_values = {}
-        for key, value in variation.items():
-            if key != "name" and hasattr(config, key.upper() + "_CONFIG"):
-                config_dict = getattr(config, key.upper() + "_CONFIG", {})
-                if key.split('_')[-1] in config_dict:
-                    original_values[key] = config_dict[key.split('_')[-1]]
-                    config_dict[key.split('_')[-1]] = value
-        
-        system = SimpleTrafficCoordinationSystem()
-        results = await system.run_coordination_episode(base_scenario)
-        metrics = results['coordination_metrics']
-        
-        results_comparison.append({
-            "name": variation['name'],
-            "risk_reduction": metrics['risk_reduction'],
-            "success": metrics['coordination_success'],
-            "final_risk": metrics['final_risk']
-        })
-        
-        for key, value in original_values.items():
-            config_dict = getattr(config, key.upper() + "_CONFIG", {})
-            config_dict[key.split('_')[-1]] = value
+        overrides = {key: value for key, value in variation.items() if key in config.EPISODE_OVERRIDE_FIELDS}
+        system = _new_system(
+            temperature=variation.get("llm_temperature"),
+            enable_llm_reasoning=variation.get("enable_llm_reasoning")
+        )
+        episodes.append(system.run_coordination_episode(base_scenario, overrides=overrides))
     
-    print(f"\n📊 ABLATION STUDY RESULTS:")
-    print(f"{'Variation':<15} {'Risk Reduction':<15} {'Final Risk':<12} {'Success'}")
-    print("-" * 60)
-    for result in results_comparison:
-        success_icon = "✅" if result['success'] else "❌"
-        print(f"{result['name']:<15} {result['risk_reduction']:<15.2f} {result['final_risk']:<12.2f} {success_icon}")
+    table = [
+        f"\n📊 ABLATION STUDY RESULTS:",
+        f"{'Variation':<15} {'Risk Reduction':<15} {'Final Risk':<12} {'Success'}",
+        "-" * 60
+    ]
+    for variation, results in zip(test_variations, await _gather_bounded(episodes)):
+        if results is None:
+            table.append(f"{variation['name']:<15} timed out")
+            continue
+        metrics = results['coordination_metrics']
+        success_icon = _SUCCESS_ICONS[metrics['coordination_success']]
+        table.append(f"{variation['name']:<15} {metrics['risk_reduction']:<15.2f} {metrics['final_risk']:<12.2f} {success_icon}")
+    print("\n".join(table))
 
 async def run_parameter_sensitivity():
     print("📈 Running Parameter Sensitivity Analysis")
@@ -80,84 +136,124 @@ async def run_parameter_sensitivity():
     print(f"{'Threshold':<12} {'Agents Selected':<15} {'Risk Reduction':<15} {'Success'}")
     print("-" * 60)
     
-    for threshold in risk_thresholds:
-        original_threshold = config.NEGOTIATION_CONFIG["risk_threshold"]
-        config.NEGOTIATION_CONFIG["risk_threshold"] = threshold
-        
-        system = SimpleTrafficCoordinationSystem()
-        results = await system.run_coordination_episode(scenario)
+    episodes = await _gather_bounded(
+        _new_system().run_coordination_episode(scenario, overrides={"risk_threshold": threshold})
+        for threshold in risk_thresholds
+    )
+    
+    for threshold, results in zip(risk_thresholds, episodes):
+        if results is None:
+            print(f"{threshold:<12.1f} timed out")
+            continue
         metrics = results['coordination_metrics']
         
-        success_icon = "✅" if metrics['coordination_success'] else "❌"
+        success_icon = _SUCCESS_ICONS[metrics['coordination_success']]
         print(f"{threshold:<12.1f} {metrics['agents_participated']:<15} {metrics['risk_reduction']:<15.2f} {success_icon}")
-        
-        config.NEGOTIATION_CONFIG["risk_threshold"] = original_threshold
 
 async def demonstrate_all_scenarios():
     print("🎭 Demonstrating All Scenarios")
-    system = SimpleTrafficCoordinationSystem()
+    episodes = await _gather_bounded(
+        _timed_episode(scenario_name) for scenario_name in config.SCENARIOS_TYPED
+    )
     
-    for scenario_name, scenario_config in config.SCENARIOS.items():
+    for (scenario_name, scenario), episode in zip(config.SCENARIOS_TYPED.items(), episodes):
         print(f"\n=== {scenario_name.upper()} SCENARIO ===")
-        print(f"📝 {scenario_config['description']}")
-        print(f"🏫 {len(scenario_config['classrooms'])} classrooms")
-        print(f"🚦 {scenario_config['bottleneck_capacity']} capacity/min")
+        print(f"📝 {scenario.description}")
+        print(f"🏫 {len(scenario.classrooms)} classrooms")
+        print(f"🚦 {scenario.bottleneck_capacity} capacity/min")
         
         print("Classrooms:")
-        for classroom in scenario_config['classrooms']:
-            flexibility_desc = config.get_flexibility_description(classroom['professor_flexibility'])
-            print(f"  • {classroom['id']}: {classroom['students']} students, "
-                  f"{classroom['professor_name']} ({classroom['subject']}) - {flexibility_desc}")
-        
-        start_time = time.time()
-        results = await system.run_coordination_episode(scenario_name)
-        end_time = time.time()
+        print("\n".join(
+            f"  • {classroom.id}: {classroom.students} students, "
+            f"{classroom.professor_name} ({classroom.subject}) - "
+            f"{config.get_flexibility_description(classroom.professor_flexibility)}"
+            for classroom in scenario.classrooms
+        ))
         
+        if episode is None:
+            print("\n⏱️  Timed out")
+            continue
+        results, elapsed = episode
         metrics = results['coordination_metrics']
         print(f"\n📊 Results:")
         print(f"  Risk: {metrics['initial_risk']:.2f} -> {metrics['final_risk']:.2f} (Δ{metrics['risk_reduction']:.2f})")
-        print(f"  Success: {'✅' if metrics['coordination_success'] else '❌'}")
-        print(f"  Time: {end_time - start_time:.1f}s")
+        print(f"  Success: {_SUCCESS_ICONS[metrics['coordination_success']]}")
+        print(f"  Time: {elapsed:.1f}s")
 
 async def run_multi_episode_commitments():
     print("🗓️  Running Multi-Episode Commitment Test")
     scenario = "assignment_demo" if "assignment_demo" in config.SCENARIOS else "demo"
     episodes = 4
     interval_days = config.EXPERIMENTAL_CONFIG.get("episode_interval_days", 7)
-    start_date = datetime.now().strftime("%Y-%m-%d")
+    start_date = date.today()
 
     print(f"Scenario: {scenario}")
     print(f"Episodes: {episodes}, Interval: {interval_days} days")
 
-    system = SimpleTrafficCoordinationSystem()
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    system = _new_system()
 
     for i in range(episodes):
-        ep_date = (start_dt + timedelta(days=i * interval_days)).strftime("%Y-%m-%d")
+        ep_date = (start_date + timedelta(days=i * interval_days)).isoformat()
         print(f"\n=== EPISODE {i+1} — Date: {ep_date} ===")
-        results = await system.run_coordination_episode(scenario, ep_date)
+        results = await _time_bounded(system.run_coordination_episode(scenario, ep_date))
+        if results is None:
+            print(f"⏱️  Timed out | Success: {_SUCCESS_ICONS[False]}")
+            continue
         metrics = results["coordination_metrics"]
-        print(f"Risk: {metrics['initial_risk']:.2f} -> {metrics['final_risk']:.2f} (Δ{metrics['risk_reduction']:.2f}) | Success: {'✅' if metrics['coordination_success'] else '❌'}")
+        print(f"Risk: {metrics['initial_risk']:.2f} -> {metrics['final_risk']:.2f} (Δ{metrics['risk_reduction']:.2f}) | Success: {_SUCCESS_ICONS[metrics['coordination_success']]}")
 
         broadcasts = results.get("broadcasts", [])
-        offers = [b for b in broadcasts if b.get("type") == "commitment_offer_accepted"]
-        due_results = [b for b in broadcasts if b.get("type") == "commitment_due_result"]
-        flagged = [b for b in due_results if b.get("flag", {}) and b["flag"].get("flagged")]
+        offers, due_results, flagged = [], [], []
+        for b in broadcasts:
+            event_type = b.get("type")
+            if event_type == "commitment_offer_accepted":
+                offers.append(b)
+            elif event_type == "commitment_due_result":
+                due_results.append(b)
+                flag = b.get("flag")
+                if flag and flag.get("flagged"):
+                    flagged.append(b)
 
-        print(f"Offers accepted this episode: {len(offers)}")
+        lines = [f"Offers accepted this episode: {len(offers)}"]
         for ev in offers:
-            print(f"  • Slot {ev.get('time_slot')}: {ev.get('to')} {ev.get('adjustment'):+d}min (from {ev.get('from')}), reciprocal next: {ev.get('reciprocal', {}).get('adjustment_minutes', 0):+d}min")
+            lines.append(f"  • Slot {ev.get('time_slot')}: {ev.get('to')} {ev.get('adjustment'):+d}min (from {ev.get('from')}), reciprocal next: {ev.get('reciprocal', {}).get('adjustment_minutes', 0):+d}min")
 
-        print(f"Due commitments processed: {len(due_results)}")
+        lines.append(f"Due commitments processed: {len(due_results)}")
         for ev in due_results:
             status = ev.get('status')
-            print(f"  • {ev.get('to')} {ev.get('adjustment'):+d}min — {status}")
+            lines.append(f"  • {ev.get('to')} {ev.get('adjustment'):+d}min — {status}")
 
         if flagged:
-            print(f"Violations flagged: {len(flagged)}")
+            lines.append(f"Violations flagged: {len(flagged)}")
             for ev in flagged:
                 f = ev.get('flag', {})
-                print(f"  ⚠️  {f.get('classroom')} flagged (violations={f.get('violation_count')})")
+                lines.append(f"  ⚠️  {f.get('classroom')} flagged (violations={f.get('violation_count')})")
+        print("\n".join(lines))
+
+async def run_all_tests():
+    # The suites are independent, so they run side by side; each one's
+    # output is buffered and printed whole, in the usual order.
+    sys.stdout = _TaskLocalStdout(sys.stdout)
+    try:
+        outputs = await asyncio.gather(
+            _captured(run_quick_test()),
+            _captured(run_stress_test()),
+            _captured(run_parameter_sensitivity()),
+            _captured(demonstrate_all_scenarios())
+        )
+    finally:
+        sys.stdout = sys.stdout.stream
+    sys.stdout.write("".join(outputs))
+
+_TESTS = {
+    "quick": run_quick_test,
+    "stress": run_stress_test,
+    "ablation": run_ablation_study,
+    "sensitivity": run_parameter_sensitivity,
+    "scenarios": demonstrate_all_scenarios,
+    "episodes": run_multi_episode_commitments,
+    "all": run_all_tests
+}
 
 async def main():
     if len(sys.argv) < 2:
@@ -174,25 +270,16 @@ async def main():
     
     test_type = sys.argv[1].lower()
     
-    if test_type == "quick":
-        await run_quick_test()
-    elif test_type == "stress":
-        await run_stress_test()
-    elif test_type == "ablation":
-        await run_ablation_study()
-    elif test_type == "sensitivity":
-        await run_parameter_sensitivity()
-    elif test_type == "scenarios":
-        await demonstrate_all_scenarios()
-    elif test_type == "episodes":
-        await run_multi_episode_commitments()
-    elif test_type == "all":
-        await run_quick_test()
-        await run_stress_test()
-        await run_parameter_sensitivity()
-        await demonstrate_all_scenarios()
-    else:
+    # Python 3.12+: tasks start running inside create_task/gather, so
+    # rule-based decisions and other non-suspending coroutines skip a scheduler pass.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    test = _TESTS.get(test_type)
+    if test is None:
         print(f"Unknown test type: {test_type}")
+        return
+    await test()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,9 +1,13 @@
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 import json
+import time
 
-@dataclass
+import config
+
+@dataclass(slots=True)
 class TrafficData:
     """Traffic flow data at bottleneck point"""
     timestamp: datetime
@@ -12,7 +16,7 @@ class TrafficData:
     queue_length: int
     estimated_wait_time: int
 
-@dataclass
+@dataclass(slots=True)
 class ClassroomCommitment:
     """Commitment between classroom agents"""
     from_classroom: str
@@ -22,13 +26,13 @@ class ClassroomCommitment:
     adjustment_minutes: int
     reciprocal_commitment: Optional[Dict] = None
     status: str = "pending"  # pending, fulfilled, violated
-    created_at: datetime = None
+    created_at: int = 0  # time.time_ns() at creation
     
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+        if not self.created_at:
+            self.created_at = time.time_ns()
 
-@dataclass
+@dataclass(slots=True)
 class ClassroomState:
     """Current state of a classroom"""
     classroom_id: str
@@ -39,10 +43,13 @@ class ClassroomState:
     active_commitments: List[ClassroomCommitment] = None
     violation_count: int = 0
     reputation_score: float = 1.0
+    base_end_minutes: Optional[int] = None  # base_end_time as minutes past midnight
     
     def __post_init__(self):
         if self.active_commitments is None:
             self.active_commitments = []
+        if self.base_end_minutes is None:
+            self.base_end_minutes = config.parse_clock_minutes(self.base_end_time)
 
 class BottleneckTools:
     """Tools available to the Bottleneck Agent"""
@@ -51,17 +58,20 @@ class BottleneckTools:
     def analyze_traffic_flow(classroom_states: List[ClassroomState], 
                            capacity_per_minute: int) -> Dict[str, Any]:
         """Analyze current traffic situation and predict congestion"""
-        total_students = sum(state.current_students for state in classroom_states)
-        base_exit_times = {}
+        total_students = 0
+        slot_totals = {}
         
-        # Group classrooms by their current exit times
+        # Group classrooms by their current exit times, summing students as we go
         for state in classroom_states:
-            exit_time = BottleneckTools.calculate_exit_time(
-                state.base_end_time, state.current_adjustment
+            total_students += state.current_students
+            exit_time = config.format_clock_minutes(
+                state.base_end_minutes + state.current_adjustment
             )
-            if exit_time not in base_exit_times:
-                base_exit_times[exit_time] = []
-            base_exit_times[exit_time].append({
+            slot = slot_totals.get(exit_time)
+            if slot is None:
+                slot = slot_totals[exit_time] = [0, []]
+            slot[0] += state.current_students
+            slot[1].append({
                 'classroom': state.classroom_id,
                 'students': state.current_students
             })
@@ -71,8 +81,7 @@ class BottleneckTools:
         max_congestion = 0
         critical_times = []
         
-        for time_slot, classrooms in base_exit_times.items():
-            slot_students = sum(c['students'] for c in classrooms)
+        for time_slot, (slot_students, classrooms) in slot_totals.items():
             congestion_ratio = slot_students / capacity_per_minute
             
             congestion_analysis[time_slot] = {
@@ -80,9 +89,7 @@ class BottleneckTools:
                 'capacity': capacity_per_minute,
                 'congestion_ratio': congestion_ratio,
                 'classrooms': classrooms,
-                'status': 'critical' if congestion_ratio > 1.5 else 
-                         'high' if congestion_ratio > 1.0 else
-                         'moderate' if congestion_ratio > 0.7 else 'normal'
+                'status': config.classify_risk(congestion_ratio)
             }
             
             if congestion_ratio > max_congestion:
@@ -91,18 +98,23 @@ class BottleneckTools:
             if congestion_ratio > 1.0:
                 critical_times.append(time_slot)
         
+        # Recommendations only target high/critical slots, so an episode whose
+        # worst slot is at most moderate has none to generate.
+        if max_congestion > config.RISK_THRESHOLDS.moderate:
+            recommendations = BottleneckTools._generate_recommendations(
+                congestion_analysis, critical_times
+            )
+        else:
+            recommendations = []
+        
         return {
             'total_students': total_students,
             'capacity_per_minute': capacity_per_minute,
             'max_congestion_ratio': max_congestion,
             'critical_time_slots': critical_times,
             'time_slot_analysis': congestion_analysis,
-            'overall_status': 'critical' if max_congestion > 1.5 else
-                            'high' if max_congestion > 1.0 else
-                            'moderate' if max_congestion > 0.7 else 'normal',
-            'recommendations': BottleneckTools._generate_recommendations(
-                congestion_analysis, critical_times
-            )
+            'overall_status': config.classify_risk(max_congestion),
+            'recommendations': recommendations
         }
     
     @staticmethod
@@ -168,9 +180,7 @@ class BottleneckTools:
     @staticmethod
     def calculate_exit_time(base_time: str, adjustment_minutes: int) -> str:
         """Calculate actual exit time with adjustments"""
-        base_dt = datetime.strptime(base_time, "%H:%M")
-        adjusted_dt = base_dt + timedelta(minutes=adjustment_minutes)
-        return adjusted_dt.strftime("%H:%M")
+        return config.format_clock_minutes(config.parse_clock_minutes(base_time) + adjustment_minutes)
 
 class ClassroomTools:
     """Tools available to Classroom Agents"""
@@ -194,14 +204,15 @@ class ClassroomTools:
         else:  # Shortening
             if flexibility <= -0.3:  # Professor likes shorter classes
                 feasibility = min(1.0, 0.8 + abs(flexibility) * 0.2)
-            elif flexibility >= -0.3 and flexibility <= 0.3:  # Neutral
+            elif flexibility <= 0.3:  # Neutral
                 feasibility = 0.6 - abs(suggested_adjustment) * 0.05
             else:  # Professor prefers longer classes
                 feasibility = max(0.1, 0.4 - flexibility * 0.3)
         
         # Apply constraints
         max_adjustment = 8  # Maximum 8 minutes adjustment
-        if abs(total_adjustment) > max_adjustment:
+        within_limits = abs(total_adjustment) <= max_adjustment
+        if not within_limits:
             feasibility *= 0.3
         
         return {
@@ -213,7 +224,7 @@ class ClassroomTools:
             ),
             'constraints': {
                 'max_total_adjustment': max_adjustment,
-                'within_limits': abs(total_adjustment) <= max_adjustment
+                'within_limits': within_limits
             }
         }
     
@@ -261,15 +272,15 @@ class ClassroomTools:
         )
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def _get_next_episode_date(current_date: str) -> str:
         """Get next episode date (next week)"""
-        current_dt = datetime.strptime(current_date, "%Y-%m-%d")
-        next_dt = current_dt + timedelta(days=7)
-        return next_dt.strftime("%Y-%m-%d")
+        return (date.fromisoformat(current_date) + timedelta(days=7)).isoformat()
     
     @staticmethod
     def evaluate_commitment_offer(classroom_state: ClassroomState,
-                                commitment_offer: ClassroomCommitment) -> Dict[str, Any]:
+                                commitment_offer: ClassroomCommitment,
+                                current_eval: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Evaluate an incoming commitment offer"""
         # Check current capacity for reciprocal commitment
         can_fulfill_reciprocal = True
@@ -283,10 +294,11 @@ class ClassroomTools:
             can_fulfill_reciprocal = reciprocal_eval['is_feasible']
             reciprocal_feasibility = reciprocal_eval['feasibility_score']
         
-        # Evaluate current adjustment
-        current_eval = ClassroomTools.evaluate_adjustment_feasibility(
-            classroom_state, commitment_offer.adjustment_minutes
-        )
+        # Evaluate current adjustment, unless the caller already did
+        if current_eval is None:
+            current_eval = ClassroomTools.evaluate_adjustment_feasibility(
+                classroom_state, commitment_offer.adjustment_minutes
+            )
         
         # Calculate overall acceptance score
         current_feasibility = current_eval['feasibility_score']
@@ -334,29 +346,48 @@ class ClassroomTools:
 class CommitmentTracker:
     """System for tracking commitments across episodes"""
     
-    def __init__(self):
-        self.active_commitments: List[ClassroomCommitment] = []
+    def __init__(self, retain_history: bool = False):
+        # Active commitments are bucketed by due date so per-episode lookups and
+        # removals only touch that episode's commitments.
+        self._active_by_episode: Dict[str, List[ClassroomCommitment]] = {}
+        # Settled commitments are only kept when asked for; reputation and
+        # violation queries use the outcome counts below.
+        self.retain_history = retain_history
         self.commitment_history: List[ClassroomCommitment] = []
+        # classroom id -> [fulfilled, total] over all settled commitments
+        self._outcome_counts: Dict[str, List[int]] = {}
         self.violation_threshold = 3
     
+    @property
+    def active_commitments(self) -> List[ClassroomCommitment]:
+        """All commitments not yet fulfilled or violated"""
+        return [c for bucket in self._active_by_episode.values() for c in bucket]
+    
     def add_commitment(self, commitment: ClassroomCommitment):
         """Add a new commitment to tracking"""
-        self.active_commitments.append(commitment)
+        self._active_by_episode.setdefault(commitment.episode_date, []).append(commitment)
     
     def get_commitments_for_episode(self, episode_date: str) -> List[ClassroomCommitment]:
         """Get all commitments due for a specific episode"""
-        return [c for c in self.active_commitments 
-                if c.episode_date == episode_date]
+        return list(self._active_by_episode.get(episode_date, ()))
     
     def fulfill_commitment(self, commitment: ClassroomCommitment, 
                           fulfilled: bool) -> Dict[str, Any]:
         """Mark a commitment as fulfilled or violated"""
         commitment.status = "fulfilled" if fulfilled else "violated"
         
-        # Move to history
-        if commitment in self.active_commitments:
-            self.active_commitments.remove(commitment)
-        self.commitment_history.append(commitment)
+        # Move out of the active set
+        bucket = self._active_by_episode.get(commitment.episode_date)
+        if bucket and commitment in bucket:
+            bucket.remove(commitment)
+            if not bucket:
+                del self._active_by_episode[commitment.episode_date]
+        if self.retain_history:
+            self.commitment_history.append(commitment)
+        counts = self._outcome_counts.setdefault(commitment.to_classroom, [0, 0])
+        if fulfilled:
+            counts[0] += 1
+        counts[1] += 1
         
         # Check for flagging
         if not fulfilled:
@@ -373,20 +404,16 @@ class CommitmentTracker:
     
     def get_violation_count(self, classroom_id: str) -> int:
         """Get total violation count for a classroom"""
-        return len([c for c in self.commitment_history 
-                   if c.to_classroom == classroom_id and c.status == "violated"])
+        fulfilled_count, total_count = self._outcome_counts.get(classroom_id, (0, 0))
+        return total_count - fulfilled_count
     
     def get_reputation_score(self, classroom_id: str) -> float:
         """Calculate reputation score based on commitment history"""
-        classroom_commitments = [c for c in self.commitment_history 
-                               if c.to_classroom == classroom_id]
+        fulfilled_count, total_count = self._outcome_counts.get(classroom_id, (0, 0))
         
-        if not classroom_commitments:
+        if not total_count:
             return 1.0  # Perfect score for new participants
         
-        fulfilled_count = len([c for c in classroom_commitments if c.status == "fulfilled"])
-        total_count = len(classroom_commitments)
-        
         base_score = fulfilled_count / total_count
         
         # Apply penalties for violations